@@ -26,7 +26,7 @@ async def main():
     
     # Get a session for the default connection
     print(f"\n🔌 Connecting to default database...")
-    session = await manager.get_session()
+    session = manager.get_session()
     
     try:
         # Execute a simple query
@@ -4,11 +4,11 @@ FastAPI integration example for pgsqlasync2fast-fastapi
 This example demonstrates:
 - FastAPI application setup
 - Dependency injection
-- Startup/shutdown events
+- Lifespan startup/shutdown with parallel pool warmup
 - Using multiple database connections in endpoints
 """
 
-from functools import partial
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
 from sqlalchemy import text
@@ -17,28 +17,27 @@ from pgsqlasync2fast_fastapi import (
     get_db_session,
     get_db_engine,
     get_db_manager,
+    make_session_dep,
     startup_database,
     shutdown_database,
     DatabaseManager,
 )
 
-# Create FastAPI app
-app = FastAPI(
-    title="PostgreSQL Async Example",
-    description="Example FastAPI application with pgsqlasync2fast-fastapi"
-)
 
-
-@app.on_event("startup")
-async def startup():
-    """Initialize database connections on startup."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Check and warm up all connections on startup, close them on shutdown."""
     await startup_database()
+    yield
+    await shutdown_database()
 
 
-@app.on_event("shutdown")
-async def shutdown():
-    """Close database connections on shutdown."""
-    await shutdown_database()
+# Create FastAPI app
+app = FastAPI(
+    title="PostgreSQL Async Example",
+    description="Example FastAPI application with pgsqlasync2fast-fastapi",
+    lifespan=lifespan,
+)
 
 
 @app.get("/")
@@ -89,17 +88,11 @@ async def list_connections(manager: DatabaseManager = Depends(get_db_manager)):
 async def get_db_info(session: AsyncSession = Depends(get_db_session)):
     """Get database information using default connection."""
     try:
-        # Get database name
-        result = await session.execute(text("SELECT current_database()"))
-        db_name = result.scalar()
-        
-        # Get current user
-        result = await session.execute(text("SELECT current_user"))
-        user = result.scalar()
-        
-        # Get server version
-        result = await session.execute(text("SELECT version()"))
-        version = result.scalar()
+        # Fetch everything in a single round-trip
+        result = await session.execute(
+            text("SELECT current_database(), current_user, version()")
+        )
+        db_name, user, version = result.one()
         
         return {
             "database": db_name,
@@ -111,27 +104,23 @@ async def get_db_info(session: AsyncSession = Depends(get_db_session)):
 
 
 @app.get("/db/version")
-async def get_version(session: AsyncSession = Depends(get_db_session)):
-    """Get PostgreSQL version."""
-    result = await session.execute(text("SELECT version()"))
-    version = result.scalar()
-    return {"version": version}
+async def get_version(manager: DatabaseManager = Depends(get_db_manager)):
+    """Get PostgreSQL version (cached per connection, no query per request)."""
+    info = await manager.server_info("default")
+    return {"version": info["version"]}
 
 
 # Example: Using a specific database connection
 # Create a dependency for a specific connection (e.g., "business")
-get_business_session = partial(get_db_session, connection_name="business")
+get_business_session = make_session_dep("business")
 
 
 @app.get("/business/info")
 async def get_business_info(session: AsyncSession = Depends(get_business_session)):
     """Get database information using business connection."""
     try:
-        result = await session.execute(text("SELECT current_database()"))
-        db_name = result.scalar()
-        
-        result = await session.execute(text("SELECT current_user"))
-        user = result.scalar()
+        result = await session.execute(text("SELECT current_database(), current_user"))
+        db_name, user = result.one()
         
         return {
             "connection": "business",
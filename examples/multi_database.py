@@ -24,19 +24,17 @@ async def main():
     connections = manager.list_connections()
     print(f"\n✅ Available connections: {connections}")
     
-    # Demonstrate using multiple connections
-    for conn_name in connections:
-        print(f"\n🔌 Connecting to '{conn_name}' database...")
-        
+    async def probe(conn_name: str) -> None:
+        """Health check and query a single connection."""
         try:
             # Health check
             is_healthy = await manager.health_check(conn_name)
             if not is_healthy:
                 print(f"❌ Connection '{conn_name}' is not healthy")
-                continue
+                return
             
             # Get a session for this connection
-            session = await manager.get_session(conn_name)
+            session = manager.get_session(conn_name)
             
             try:
                 # Get database info
@@ -49,6 +47,7 @@ async def main():
                 is_super = manager.is_superuser_connection(conn_name)
                 super_flag = " (SUPERUSER)" if is_super else ""
                 
+                print(f"\n🔌 Connection '{conn_name}':")
                 print(f"✅ Database: {db_name}")
                 print(f"✅ User: {user}{super_flag}")
                 
@@ -60,6 +59,13 @@ async def main():
         except Exception as e:
             print(f"❌ Error with connection '{conn_name}': {e}")
     
+    # Demonstrate using multiple connections simultaneously:
+    # connections are independent, so probe them all concurrently
+    await asyncio.gather(
+        *(probe(conn_name) for conn_name in connections),
+        return_exceptions=True,
+    )
+    
     # Cleanup
     print("\n🔌 Closing all connections...")
     await manager.close_all()
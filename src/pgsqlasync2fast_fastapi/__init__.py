@@ -18,8 +18,11 @@ from .connection import DatabaseManager, get_manager
 from .database import create_database, database_exists, drop_database, list_databases
 from .dependencies import (
     get_db_engine,
+    get_default_engine,
     get_db_manager,
     get_db_session,
+    make_engine_dep,
+    make_session_dep,
     shutdown_database,
     startup_database,
 )
@@ -38,7 +41,10 @@ __all__ = [
     # FastAPI dependencies
     "get_db_manager",
     "get_db_engine",
+    "get_default_engine",
     "get_db_session",
+    "make_session_dep",
+    "make_engine_dep",
     "startup_database",
     "shutdown_database",
     # Database utilities
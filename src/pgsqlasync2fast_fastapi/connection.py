@@ -2,14 +2,62 @@
 Database connection and engine management
 """
 
-from typing import AsyncGenerator, Dict, Optional
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncGenerator, Dict, Iterable, Optional
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker
+from sqlalchemy import event, text
+from sqlalchemy.exc import DisconnectionError
 
 from .settings import DatabaseSettings, settings
 
+logger = logging.getLogger(__name__)
+
+# Upper bound for autotuned pool_size / max_overflow
+MAX_AUTOTUNED_POOL_SIZE = 25
+
+
+def _install_interval_pre_ping(engine: AsyncEngine, interval: int) -> None:
+    """
+    Ping pooled connections on checkout only after they have been idle a while.
+    
+    Unlike pool_pre_ping=True, which issues a ping on every checkout, this only
+    pings connections that have sat in the pool for more than interval seconds
+    since they were opened, last pinged or last returned. A failed ping raises
+    DisconnectionError so the pool discards the connection and retries with a
+    fresh one.
+    
+    Args:
+        engine: Engine whose pool should be guarded.
+        interval: Seconds a connection may sit idle before it is pinged again.
+    """
+    sync_engine = engine.sync_engine
+    dialect = sync_engine.dialect
+    
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        connection_record.info["last_ping"] = time.monotonic()
+    
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        # A connection that was just in use is known to be alive
+        connection_record.info["last_ping"] = time.monotonic()
+    
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        now = time.monotonic()
+        if now - connection_record.info.get("last_ping", 0.0) < interval:
+            return
+        try:
+            dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise DisconnectionError("Pooled connection failed liveness check") from e
+        connection_record.info["last_ping"] = now
+
 
 class DatabaseManager:
     """
@@ -18,7 +66,7 @@ class DatabaseManager:
     This class provides:
     - Lazy engine creation (engines created only when first accessed)
     - Multiple named connections support
-    - Session factory for each connection
+    - Shared session factory bound to each connection on demand
     - Connection health checks
     - Cleanup utilities
     """
@@ -32,7 +80,21 @@ class DatabaseManager:
         """
         self.config = config
         self._engines: Dict[str, AsyncEngine] = {}
+        # Effective pool_size of each engine (explicit or autotuned)
+        self._pool_sizes: Dict[str, int] = {}
+        # One session factory shared by all connections; the engine is bound per session
+        self._session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        # Connection-bound makers, built by get_session_maker() / get_scoped_session()
         self._session_makers: Dict[str, async_sessionmaker[AsyncSession]] = {}
+        self._scoped_sessions: Dict[str, async_scoped_session[AsyncSession]] = {}
+        self._admin_engines: Dict[str, AsyncEngine] = {}
+        self._last_health: Dict[str, float] = {}
+        self._meta_cache: Dict[str, Dict[str, str]] = {}
+        self._superuser_name: Optional[str] = None
+        self._verified_superusers: frozenset[str] = frozenset()
 
     def get_engine(self, connection_name: Optional[str] = None) -> AsyncEngine:
         """
@@ -49,46 +111,175 @@ class DatabaseManager:
         """
         name = connection_name or self.config.default_connection
         
-        # Return existing engine if already created
-        if name in self._engines:
-            return self._engines[name]
+        # Return existing engine if already created (single dict probe)
+        engine = self._engines.get(name)
+        if engine is not None:
+            return engine
         
-        # Get connection settings
-        conn_settings = self.config.get_connection(name)
-        
-        # Build connection URL
-        url = self.config.get_connection_url(name)
+        # Get connection settings (frozen snapshot, includes the rendered URL)
+        conn_settings = self.config.get_connection_snapshot(name)
+        url = conn_settings.url
         
         # Determine echo mode (connection-specific overrides global)
         echo = conn_settings.echo if conn_settings.echo else self.config.echo
         
+        # Pool sizing: configured values (or their defaults), unless autotuning
+        # was requested, in which case only explicitly set values are kept
+        pool_size = conn_settings.pool_size
+        max_overflow = conn_settings.max_overflow
+        if conn_settings.pool_autotune:
+            tuned = self.autotune_pool()
+            if not conn_settings.pool_size_explicit:
+                pool_size = tuned["pool_size"]
+            if not conn_settings.max_overflow_explicit:
+                max_overflow = tuned["max_overflow"]
+        
+        # Verify connections before using them (if enabled): on every checkout,
+        # or only once they have been idle longer than pool_pre_ping_interval
+        pre_ping = conn_settings.pool_pre_ping
+        ping_interval = conn_settings.pool_pre_ping_interval
+        
         # Create engine with pool settings
         engine = create_async_engine(
             url,
             echo=echo,
-            pool_size=conn_settings.pool_size,
-            max_overflow=conn_settings.max_overflow,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
             pool_timeout=conn_settings.pool_timeout,
             pool_recycle=conn_settings.pool_recycle,
-            pool_pre_ping=True,  # Verify connections before using them
+            pool_pre_ping=pre_ping and ping_interval == 0,
+            pool_use_lifo=conn_settings.pool_use_lifo,
         )
+        if pre_ping and ping_interval > 0:
+            _install_interval_pre_ping(engine, ping_interval)
         
         # Store engine
         self._engines[name] = engine
+        self._pool_sizes[name] = pool_size
         
-        # Create session maker for this engine
-        self._session_makers[name] = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
+        return engine
+
+    @classmethod
+    def autotune_pool(cls, concurrency: Optional[int] = None) -> Dict[str, int]:
+        """
+        Suggest pool sizing for a given level of concurrency.
+        
+        Used by get_engine() for connections with pool_autotune=true. Pool sizes
+        beyond ~25 connections per process stop improving PostgreSQL throughput
+        and only add server-side contention, so both values are capped.
+        
+        The (2 * cores + 1) rule of thumb refers to the database server's cores;
+        without a concurrency value this falls back to the local CPU count, which
+        is only a fair estimate when the application and database hosts are
+        similar. Every worker process gets its own pool, so make sure
+        WEB_CONCURRENCY reflects the worker count (e.g. gunicorn -w) and that
+        workers * (pool_size + max_overflow) stays below max_connections.
+        
+        Args:
+            concurrency: Expected concurrent database operations per process. If None,
+                        uses (2 * local CPU cores + 1) split across the
+                        WEB_CONCURRENCY worker processes.
+            
+        Returns:
+            Dictionary with "pool_size" and "max_overflow" keys.
+        """
+        if concurrency is None:
+            try:
+                workers = max(1, int(os.environ.get("WEB_CONCURRENCY") or 1))
+            except ValueError:
+                workers = 1
+            total = (os.cpu_count() or 1) * 2 + 1
+            concurrency = -(-total // workers)  # ceil division
+        
+        size = max(1, min(concurrency, MAX_AUTOTUNED_POOL_SIZE))
+        return {"pool_size": size, "max_overflow": size}
+
+    def get_admin_engine(self, connection_name: Optional[str] = None) -> AsyncEngine:
+        """
+        Get or create an AUTOCOMMIT engine for administrative operations.
+        
+        Statements such as CREATE DATABASE / DROP DATABASE cannot run inside a
+        transaction block, so admin utilities use a small dedicated pool with
+        AUTOCOMMIT isolation instead of switching the isolation level on every
+        checkout.
+        
+        Args:
+            connection_name: Name of the connection. If None, uses default_connection.
+            
+        Returns:
+            AUTOCOMMIT AsyncEngine for the requested connection.
+            
+        Raises:
+            ValueError: If connection doesn't exist.
+        """
+        name = connection_name or self.config.default_connection
+        
+        # Return existing admin engine if already created
+        engine = self._admin_engines.get(name)
+        if engine is not None:
+            return engine
+        
+        conn_settings = self.config.get_connection_snapshot(name)
+        url = conn_settings.url
+        echo = conn_settings.echo if conn_settings.echo else self.config.echo
+        
+        engine = create_async_engine(
+            url,
+            echo=echo,
+            isolation_level="AUTOCOMMIT",
+            pool_size=2,
+            max_overflow=0,
+            pool_timeout=conn_settings.pool_timeout,
+            pool_recycle=conn_settings.pool_recycle,
+            pool_pre_ping=True,
         )
         
+        self._admin_engines[name] = engine
         return engine
 
+    def make_engine(
+        self,
+        connection_name: Optional[str] = None,
+        database: Optional[str] = None,
+        **engine_kwargs: Any,
+    ) -> AsyncEngine:
+        """
+        Create a new, uncached engine for a database reachable through a connection.
+        
+        Reuses the connection's credentials and host and only swaps the database
+        name, which is handy for working with databases created at runtime.
+        The caller owns the engine and must dispose it.
+        
+        Args:
+            connection_name: Name of the connection. If None, uses default_connection.
+            database: Database to connect to. If None, uses the connection's database.
+            **engine_kwargs: Extra keyword arguments for create_async_engine.
+            
+        Returns:
+            New AsyncEngine for the requested database.
+            
+        Example:
+            engine = manager.make_engine("default", database="my_new_db")
+            try:
+                async with engine.connect() as conn:
+                    ...
+            finally:
+                await engine.dispose()
+        """
+        conn_settings = self.config.get_connection_snapshot(connection_name)
+        engine_kwargs.setdefault(
+            "echo", conn_settings.echo if conn_settings.echo else self.config.echo
+        )
+        return create_async_engine(conn_settings.url_for_database(database), **engine_kwargs)
+
     def get_session_maker(self, connection_name: Optional[str] = None) -> async_sessionmaker[AsyncSession]:
         """
         Get session maker for a connection.
         
+        get_session() uses one shared, unbound session factory; a maker bound to
+        the connection's engine is only built (and cached) when this method or
+        get_scoped_session() is called.
+        
         Args:
             connection_name: Name of the connection. If None, uses default_connection.
             
@@ -97,13 +288,48 @@ class DatabaseManager:
         """
         name = connection_name or self.config.default_connection
         
-        # Ensure engine and session maker exist
-        if name not in self._session_makers:
-            self.get_engine(name)
+        session_maker = self._session_makers.get(name)
+        if session_maker is not None:
+            return session_maker
+        
+        session_maker = async_sessionmaker(
+            self.get_engine(name),
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        self._session_makers[name] = session_maker
+        return session_maker
+
+    def get_scoped_session(
+        self, connection_name: Optional[str] = None
+    ) -> async_scoped_session[AsyncSession]:
+        """
+        Get the task-scoped session registry for a connection.
+        
+        Sessions obtained from the registry are keyed to the current asyncio
+        task, so every dependency resolved while handling one request shares a
+        single session (and a single pool checkout) per connection.
+        
+        Args:
+            connection_name: Name of the connection. If None, uses default_connection.
+            
+        Returns:
+            async_scoped_session registry for the requested connection.
+        """
+        name = connection_name or self.config.default_connection
+        
+        scoped = self._scoped_sessions.get(name)
+        if scoped is not None:
+            return scoped
         
-        return self._session_makers[name]
+        scoped = async_scoped_session(
+            self.get_session_maker(name),
+            scopefunc=asyncio.current_task,
+        )
+        self._scoped_sessions[name] = scoped
+        return scoped
 
-    async def get_session(self, connection_name: Optional[str] = None) -> AsyncSession:
+    def get_session(self, connection_name: Optional[str] = None) -> AsyncSession:
         """
         Create a new async session for a connection.
         
@@ -114,10 +340,10 @@ class DatabaseManager:
             New AsyncSession instance.
             
         Note:
+            This method is synchronous: creating a session performs no I/O.
             Remember to close the session when done, or use it in an async context manager.
         """
-        session_maker = self.get_session_maker(connection_name)
-        return session_maker()
+        return self._session_maker(bind=self.get_engine(connection_name))
 
     async def close_all(self) -> None:
         """
@@ -125,31 +351,137 @@ class DatabaseManager:
         
         This should be called on application shutdown.
         """
-        for engine in self._engines.values():
-            await engine.dispose()
+        # Dispose all engines concurrently; one failing dispose must not
+        # prevent the others from closing their connections
+        labels = [*self._engines, *(f"{name} (admin)" for name in self._admin_engines)]
+        engines = [*self._engines.values(), *self._admin_engines.values()]
+        results = await asyncio.gather(
+            *(engine.dispose() for engine in engines),
+            return_exceptions=True,
+        )
+        for label, result in zip(labels, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to dispose engine '%s': %s", label, result)
         
         self._engines.clear()
+        self._pool_sizes.clear()
+        self._admin_engines.clear()
+        self._last_health.clear()
+        self._meta_cache.clear()
         self._session_makers.clear()
+        self._scoped_sessions.clear()
+        self._superuser_name = None
+        self._verified_superusers = frozenset()
 
-    async def health_check(self, connection_name: Optional[str] = None) -> bool:
+    async def health_check(self, connection_name: Optional[str] = None, ttl: float = 5.0) -> bool:
         """
         Check if a database connection is healthy.
         
+        A successful check is remembered for ttl seconds; calls within that
+        window return True without another round-trip to the server.
+        
         Args:
             connection_name: Name of the connection. If None, uses default_connection.
+            ttl: Seconds a successful check stays valid. Use 0 to always query the server.
             
         Returns:
             True if connection is healthy, False otherwise.
         """
+        name = connection_name or self.config.default_connection
+        
+        # Fast path: recently verified connection
+        last_ok = self._last_health.get(name)
+        if last_ok is not None and time.monotonic() - last_ok < ttl:
+            return True
+        
         try:
-            engine = self.get_engine(connection_name)
+            engine = self.get_engine(name)
             async with engine.connect() as conn:
                 await conn.execute(text("SELECT 1"))
+            self._last_health[name] = time.monotonic()
             return True
         except Exception as e:
-            print(f"Health check failed for connection '{connection_name}': {e}")
+            self._last_health.pop(name, None)
+            logger.warning("Health check failed for connection '%s': %s", name, e)
             return False
 
+    async def server_info(self, connection_name: Optional[str] = None) -> Dict[str, str]:
+        """
+        Get the database name and server version for a connection.
+        
+        These values never change for the lifetime of the process, so they are
+        fetched once per connection and served from cache afterwards.
+        
+        Args:
+            connection_name: Name of the connection. If None, uses default_connection.
+            
+        Returns:
+            Dictionary with "database" and "version" keys.
+        """
+        name = connection_name or self.config.default_connection
+        
+        info = self._meta_cache.get(name)
+        if info is not None:
+            return info
+        
+        engine = self.get_engine(name)
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT current_database(), version()"))
+            database, version = result.one()
+        
+        info = {"database": database, "version": version}
+        self._meta_cache[name] = info
+        return info
+
+    async def warmup_connection(self, connection_name: Optional[str] = None) -> None:
+        """
+        Create the engine for a connection and fill its pool.
+        
+        Opens pool_size connections concurrently and runs SELECT 1 on each, so
+        the first requests are served from a warm pool instead of paying the
+        engine and connection bootstrap cost. Also builds the connection's
+        scoped session registry, runs one query through an AsyncSession and
+        primes the server_info() cache.
+        
+        Args:
+            connection_name: Name of the connection. If None, uses default_connection.
+        """
+        name = connection_name or self.config.default_connection
+        engine = self.get_engine(name)
+        self.get_scoped_session(name)
+        
+        async def _ping() -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        
+        await asyncio.gather(*(_ping() for _ in range(self._pool_sizes[name])))
+        
+        # Run the session path once so its first use isn't paid by a request
+        async with self.get_session(name) as session:
+            await session.execute(text("SELECT 1"))
+        
+        await self.server_info(name)
+
+    async def warmup(self, connection_names: Optional[Iterable[str]] = None) -> None:
+        """
+        Pre-create engines and fill pools for several connections concurrently.
+        
+        A connection that fails to warm up is logged and skipped; it does not
+        abort the warmup of the others.
+        
+        Args:
+            connection_names: Names of the connections to warm up.
+                             If None, warms up all configured connections.
+        """
+        names = list(self.list_connections() if connection_names is None else connection_names)
+        results = await asyncio.gather(
+            *(self.warmup_connection(name) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.warning("Warmup failed for connection '%s': %s", name, result)
+
     def list_connections(self) -> list[str]:
         """
         List all configured connection names.
@@ -172,6 +504,49 @@ class DatabaseManager:
         conn = self.config.get_connection(connection_name)
         return conn.is_superuser
 
+    def resolve_superuser(self, connection_name: Optional[str] = None) -> str:
+        """
+        Resolve and verify the superuser connection to use for admin operations.
+        
+        The first superuser connection name is looked up once and cached, and each
+        connection name is verified for superuser privileges only the first time
+        it is used. Both caches are reset by close_all().
+        
+        Args:
+            connection_name: Name of the superuser connection to use.
+                            If None, uses the first connection with is_superuser=True.
+            
+        Returns:
+            Name of the verified superuser connection.
+            
+        Raises:
+            ValueError: If no superuser connection is available or the connection
+                       does not have superuser privileges.
+        """
+        if connection_name is None:
+            if self._superuser_name is None:
+                self._superuser_name = self.config.get_superuser_connection_name()
+            connection_name = self._superuser_name
+            if connection_name is None:
+                raise ValueError(
+                    "No superuser connection available. "
+                    "Please configure a connection with is_superuser=true"
+                )
+        
+        # Fast path: connection already verified
+        if connection_name in self._verified_superusers:
+            return connection_name
+        
+        # Verify the connection has superuser privileges
+        if not self.is_superuser_connection(connection_name):
+            raise ValueError(
+                f"Connection '{connection_name}' does not have superuser privileges. "
+                f"Set is_superuser=true in the connection configuration."
+            )
+        
+        self._verified_superusers = self._verified_superusers | {connection_name}
+        return connection_name
+
 
 # Global singleton instance
 _manager: Optional[DatabaseManager] = None
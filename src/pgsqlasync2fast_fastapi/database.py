@@ -2,13 +2,81 @@
 Database creation and management utilities
 """
 
+import logging
+import re
 from typing import List, Optional
 
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .connection import get_manager
-from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL SQLSTATE codes used to detect existing/missing databases
+_DUPLICATE_DATABASE = "42P04"
+_INVALID_CATALOG_NAME = "3D000"
+
+# Unquoted-safe PostgreSQL identifier (63 bytes max, NAMEDATALEN - 1)
+_IDENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]{0,62}")
+
+# Static statements are built once so each call reuses the TextClause instead of
+# re-parsing its bind parameters (the SQL caches already key on the text itself)
+_EXISTS_SQL = text("SELECT 1 FROM pg_database WHERE datname = :dbname")
+_LIST_DB_SQL = text(
+    "SELECT datname FROM pg_database WHERE datistemplate = false ORDER BY datname"
+)
+_TERMINATE_SQL = text(
+    "SELECT pg_terminate_backend(pg_stat_activity.pid) "
+    "FROM pg_stat_activity "
+    "WHERE pg_stat_activity.datname = :dbname "
+    "AND pid <> pg_backend_pid()"
+)
+
+
+def _sqlstate(error: DBAPIError) -> Optional[str]:
+    """Return the PostgreSQL SQLSTATE code of a driver error, if available."""
+    return getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+
+
+def _validate_identifier(value: str, kind: str) -> str:
+    """
+    Validate a database/role name before it is interpolated into DDL.
+    
+    Args:
+        value: Identifier to validate.
+        kind: Human readable kind of identifier (used in the error message).
+        
+    Returns:
+        The identifier, unchanged.
+        
+    Raises:
+        ValueError: If the identifier is not a valid PostgreSQL identifier.
+    """
+    if not _IDENT.fullmatch(value):
+        raise ValueError(
+            f"Invalid {kind} '{value}'. Names must start with a letter or underscore, "
+            f"contain only letters, digits and underscores, and be at most 63 characters."
+        )
+    return value
+
+
+def _resolve_admin_conn(connection_name: Optional[str] = None) -> str:
+    """
+    Resolve the superuser connection to use for an admin operation.
+    
+    Args:
+        connection_name: Name of the superuser connection to use.
+                        If None, uses the first connection with is_superuser=True.
+        
+    Returns:
+        Name of the verified superuser connection.
+        
+    Raises:
+        ValueError: If no superuser connection is available.
+    """
+    return get_manager().resolve_superuser(connection_name)
 
 
 async def database_exists(
@@ -35,33 +103,12 @@ async def database_exists(
             await create_database("my_new_db")
     """
     manager = get_manager()
+    connection_name = _resolve_admin_conn(connection_name)
     
-    # Find superuser connection
-    if connection_name is None:
-        connection_name = settings.get_superuser_connection_name()
-        if connection_name is None:
-            raise ValueError(
-                "No superuser connection available. "
-                "Please configure a connection with is_superuser=true"
-            )
-    
-    # Verify the connection has superuser privileges
-    if not manager.is_superuser_connection(connection_name):
-        raise ValueError(
-            f"Connection '{connection_name}' does not have superuser privileges. "
-            f"Set is_superuser=true in the connection configuration."
-        )
-    
-    engine = manager.get_engine(connection_name)
+    engine = manager.get_admin_engine(connection_name)
     
     async with engine.connect() as conn:
-        # Use isolation_level to allow database operations
-        await conn.execution_options(isolation_level="AUTOCOMMIT")
-        
-        result = await conn.execute(
-            text("SELECT 1 FROM pg_database WHERE datname = :dbname"),
-            {"dbname": database_name}
-        )
+        result = await conn.execute(_EXISTS_SQL, {"dbname": database_name})
         return result.scalar() is not None
 
 
@@ -83,7 +130,8 @@ async def create_database(
         True if database was created, False if it already exists.
         
     Raises:
-        ValueError: If no superuser connection is available.
+        ValueError: If no superuser connection is available or database_name/owner
+                   are not valid identifiers.
         Exception: If database creation fails.
         
     Example:
@@ -91,43 +139,34 @@ async def create_database(
         if created:
             print("Database created successfully!")
     """
-    manager = get_manager()
-    
-    # Find superuser connection
-    if connection_name is None:
-        connection_name = settings.get_superuser_connection_name()
-        if connection_name is None:
-            raise ValueError(
-                "No superuser connection available. "
-                "Please configure a connection with is_superuser=true"
-            )
+    _validate_identifier(database_name, "database name")
+    if owner:
+        _validate_identifier(owner, "owner name")
     
-    # Verify the connection has superuser privileges
-    if not manager.is_superuser_connection(connection_name):
-        raise ValueError(
-            f"Connection '{connection_name}' does not have superuser privileges. "
-            f"Set is_superuser=true in the connection configuration."
-        )
-    
-    # Check if database already exists
-    if await database_exists(database_name, connection_name):
-        print(f"⚠️  Database '{database_name}' already exists")
-        return False
+    manager = get_manager()
+    connection_name = _resolve_admin_conn(connection_name)
     
-    engine = manager.get_engine(connection_name)
+    engine = manager.get_admin_engine(connection_name)
     
     async with engine.connect() as conn:
-        # Use AUTOCOMMIT isolation level for CREATE DATABASE
-        await conn.execution_options(isolation_level="AUTOCOMMIT")
-        
-        # Build CREATE DATABASE query
+        # Build CREATE DATABASE query (identifiers validated above)
         if owner:
-            query = text(f'CREATE DATABASE "{database_name}" OWNER "{owner}"')
+            query = f'CREATE DATABASE "{database_name}" OWNER "{owner}"'
         else:
-            query = text(f'CREATE DATABASE "{database_name}"')
+            query = f'CREATE DATABASE "{database_name}"'
         
-        await conn.execute(query)
-        print(f"✅ Database '{database_name}' created successfully")
+        # CREATE DATABASE cannot run inside a DO block or function, so the
+        # existence check is delegated to the server's duplicate_database error.
+        # One-shot DDL goes straight to the driver, skipping statement compilation.
+        try:
+            await conn.exec_driver_sql(query)
+        except DBAPIError as e:
+            if _sqlstate(e) != _DUPLICATE_DATABASE:
+                raise
+            logger.warning("Database '%s' already exists", database_name)
+            return False
+        
+        logger.info("Database '%s' created successfully", database_name)
         return True
 
 
@@ -149,8 +188,9 @@ async def drop_database(
         True if database was dropped, False if it doesn't exist.
         
     Raises:
-        ValueError: If no superuser connection is available or attempting to drop
-                   a protected database (postgres, template0, template1).
+        ValueError: If no superuser connection is available, database_name is not
+                   a valid identifier, or attempting to drop a protected database
+                   (postgres, template0, template1).
         Exception: If database drop fails.
         
     Warning:
@@ -161,6 +201,8 @@ async def drop_database(
         if dropped:
             print("Database dropped successfully!")
     """
+    _validate_identifier(database_name, "database name")
+    
     # Safety check: prevent dropping system databases
     protected_databases = ["postgres", "template0", "template1"]
     if database_name in protected_databases:
@@ -170,49 +212,26 @@ async def drop_database(
         )
     
     manager = get_manager()
+    connection_name = _resolve_admin_conn(connection_name)
     
-    # Find superuser connection
-    if connection_name is None:
-        connection_name = settings.get_superuser_connection_name()
-        if connection_name is None:
-            raise ValueError(
-                "No superuser connection available. "
-                "Please configure a connection with is_superuser=true"
-            )
-    
-    # Verify the connection has superuser privileges
-    if not manager.is_superuser_connection(connection_name):
-        raise ValueError(
-            f"Connection '{connection_name}' does not have superuser privileges. "
-            f"Set is_superuser=true in the connection configuration."
-        )
-    
-    # Check if database exists
-    if not await database_exists(database_name, connection_name):
-        print(f"⚠️  Database '{database_name}' does not exist")
-        return False
-    
-    engine = manager.get_engine(connection_name)
+    engine = manager.get_admin_engine(connection_name)
     
     async with engine.connect() as conn:
-        # Use AUTOCOMMIT isolation level for DROP DATABASE
-        await conn.execution_options(isolation_level="AUTOCOMMIT")
-        
         # Terminate existing connections if force=True
         if force:
-            await conn.execute(
-                text(
-                    "SELECT pg_terminate_backend(pg_stat_activity.pid) "
-                    "FROM pg_stat_activity "
-                    "WHERE pg_stat_activity.datname = :dbname "
-                    "AND pid <> pg_backend_pid()"
-                ),
-                {"dbname": database_name}
-            )
+            await conn.execute(_TERMINATE_SQL, {"dbname": database_name})
+        
+        # Drop the database (a missing database is reported by the server
+        # as invalid_catalog_name instead of a separate existence query)
+        try:
+            await conn.exec_driver_sql(f'DROP DATABASE "{database_name}"')
+        except DBAPIError as e:
+            if _sqlstate(e) != _INVALID_CATALOG_NAME:
+                raise
+            logger.warning("Database '%s' does not exist", database_name)
+            return False
         
-        # Drop the database
-        await conn.execute(text(f'DROP DATABASE "{database_name}"'))
-        print(f"✅ Database '{database_name}' dropped successfully")
+        logger.info("Database '%s' dropped successfully", database_name)
         return True
 
 
@@ -236,27 +255,10 @@ async def list_databases(connection_name: Optional[str] = None) -> List[str]:
             print(f"  - {db}")
     """
     manager = get_manager()
+    connection_name = _resolve_admin_conn(connection_name)
     
-    # Find superuser connection
-    if connection_name is None:
-        connection_name = settings.get_superuser_connection_name()
-        if connection_name is None:
-            raise ValueError(
-                "No superuser connection available. "
-                "Please configure a connection with is_superuser=true"
-            )
-    
-    # Verify the connection has superuser privileges
-    if not manager.is_superuser_connection(connection_name):
-        raise ValueError(
-            f"Connection '{connection_name}' does not have superuser privileges. "
-            f"Set is_superuser=true in the connection configuration."
-        )
-    
-    engine = manager.get_engine(connection_name)
+    engine = manager.get_admin_engine(connection_name)
     
     async with engine.connect() as conn:
-        result = await conn.execute(
-            text("SELECT datname FROM pg_database WHERE datistemplate = false ORDER BY datname")
-        )
-        return [row[0] for row in result.fetchall()]
+        result = await conn.execute(_LIST_DB_SQL)
+        return list(result.scalars())
@@ -2,7 +2,11 @@
 FastAPI dependencies for database functionality
 """
 
-from typing import AsyncGenerator, Optional
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncGenerator, AsyncIterator, Callable, Optional
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
@@ -10,20 +14,42 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from .connection import DatabaseManager, get_manager
 from .settings import DatabaseSettings, settings
 
+logger = logging.getLogger(__name__)
 
-def get_db_manager(config: DatabaseSettings = Depends(lambda: settings)) -> DatabaseManager:
+
+@lru_cache(maxsize=1)
+def _cached_manager() -> DatabaseManager:
+    """Resolve the DatabaseManager singleton once for the whole process."""
+    return get_manager(settings)
+
+
+def get_db_manager() -> DatabaseManager:
     """
     FastAPI dependency for DatabaseManager.
     
-    Returns singleton instance.
+    Returns singleton instance. The manager is resolved once and cached across
+    requests, and the dependency has no sub-dependencies of its own.
     
     Usage:
         @app.get("/items")
         async def get_items(manager: DatabaseManager = Depends(get_db_manager)):
             engine = manager.get_engine("default")
             ...
+    
+    Testing:
+        Swap the manager with FastAPI's dependency overrides instead of a
+        settings sub-dependency. Build the manager once: the override runs on
+        every request, and each new manager opens its own pools.
+        
+        test_manager = DatabaseManager(test_settings)
+        app.dependency_overrides[get_db_manager] = lambda: test_manager
+        ...
+        await test_manager.close_all()
+        
+        startup_database() / shutdown_database() still act on the global
+        get_manager() singleton, not on the override.
     """
-    return get_manager(config)
+    return _cached_manager()
 
 
 def get_db_engine(
@@ -72,35 +98,133 @@ async def get_db_session(
             return items
             
         # Or with a specific connection:
-        from functools import partial
+        get_business_session = make_session_dep("business")
         
-        get_business_session = partial(get_db_session, connection_name="business")
+        @app.get("/business/items")
+        async def get_business_items(session: AsyncSession = Depends(get_business_session)):
+            ...
+    
+    Note:
+        Sessions are scoped to the current request task: if several dependencies
+        of one request ask for a session on the same connection, they all share
+        one session, and only the outermost one commits and releases it.
+        
+        The commit runs in the dependency's exit code. On FastAPI 0.121+ declare
+        the dependency with Depends(get_db_session, scope="function") to make the
+        commit complete before the response is sent; with the default
+        scope="request" it runs after the response has been sent.
+    """
+    async with _session_scope(manager, connection_name) as session:
+        yield session
+
+
+def make_session_dep(
+    connection_name: str = "default",
+) -> Callable[..., AsyncGenerator[AsyncSession, None]]:
+    """
+    Build a get_db_session dependency bound to one connection.
+    
+    Unlike get_db_session, the returned dependency exposes no connection_name
+    parameter, so FastAPI has nothing to parse from the request for it.
+    
+    Args:
+        connection_name: Name of the database connection to use.
+        
+    Returns:
+        Dependency yielding an AsyncSession for the connection.
+        
+    Usage:
+        get_business_session = make_session_dep("business")
         
         @app.get("/business/items")
         async def get_business_items(session: AsyncSession = Depends(get_business_session)):
             ...
     """
-    session = await manager.get_session(connection_name)
+    async def _dep(
+        manager: DatabaseManager = Depends(get_db_manager),
+    ) -> AsyncGenerator[AsyncSession, None]:
+        async with _session_scope(manager, connection_name) as session:
+            yield session
+    
+    return _dep
+
+
+def make_engine_dep(connection_name: str = "default") -> Callable[..., AsyncEngine]:
+    """
+    Build a get_db_engine dependency bound to one connection.
+    
+    Unlike get_db_engine, the returned dependency exposes no connection_name
+    parameter. The engine comes from the manager's engine cache (filled by
+    startup_database() and emptied by close_all()), and the manager is resolved
+    through get_db_manager so dependency_overrides apply.
+    
+    Args:
+        connection_name: Name of the database connection to use.
+        
+    Returns:
+        Dependency returning the AsyncEngine for the connection.
+    """
+    def _dep(manager: DatabaseManager = Depends(get_db_manager)) -> AsyncEngine:
+        return manager.get_engine(connection_name)
+    
+    return _dep
+
+
+def get_default_engine(manager: DatabaseManager = Depends(get_db_manager)) -> AsyncEngine:
+    """
+    FastAPI dependency for the default connection's AsyncEngine.
+    
+    Counterpart of get_db_engine without a connection_name request parameter;
+    uses the manager's default_connection.
+    
+    Args:
+        manager: DatabaseManager instance (injected).
+        
+    Returns:
+        AsyncEngine for the default connection.
+        
+    Usage:
+        @app.get("/health")
+        async def health(engine: AsyncEngine = Depends(get_default_engine)):
+            ...
+    """
+    return manager.get_engine()
+
+
+@asynccontextmanager
+async def _session_scope(
+    manager: DatabaseManager,
+    connection_name: Optional[str],
+) -> AsyncIterator[AsyncSession]:
+    """Open (or join) the request-scoped session and commit/rollback on exit."""
+    scoped = manager.get_scoped_session(connection_name)
+    
+    # Session already opened for this request by another dependency
+    if scoped.registry.has():
+        yield scoped()
+        return
+    
+    session = scoped()
     try:
         yield session
-        await session.commit()
-    except Exception:
-        await session.rollback()
-        raise
+        # Nothing to commit if the endpoint never began (or already ended) a transaction
+        if session.in_transaction():
+            await session.commit()
     finally:
-        await session.close()
+        # On any exception (including HTTPException and task cancellation) the
+        # open transaction is rolled back by closing the session, which returns
+        # its connection to the pool; no separate rollback round-trip is needed
+        await scoped.remove()
 
 
-async def startup_database(config: Optional[DatabaseSettings] = None) -> DatabaseManager:
+async def startup_database(
+    config: Optional[DatabaseSettings] = None,
+    warmup: bool = True,
+) -> DatabaseManager:
     """
     Initialize database connections on application startup.
     
-    Usage in FastAPI:
-        @app.on_event("startup")
-        async def startup():
-            await startup_database()
-            
-    Or with lifespan (FastAPI 0.93+):
+    Usage in FastAPI (lifespan, FastAPI 0.93+):
         from contextlib import asynccontextmanager
         
         @asynccontextmanager
@@ -115,19 +239,37 @@ async def startup_database(config: Optional[DatabaseSettings] = None) -> Databas
     
     Args:
         config: Database settings (uses global settings if not provided)
+        warmup: If True, pre-fill the pool of every healthy connection so the
+                first requests don't pay the connection bootstrap cost
         
     Returns:
         Initialized DatabaseManager instance
     """
     manager = get_manager(config)
     
-    # Optionally perform health checks on all connections
-    print("🔌 Initializing database connections...")
-    for conn_name in manager.list_connections():
-        is_healthy = await manager.health_check(conn_name)
-        status = "✅" if is_healthy else "❌"
-        superuser = " (superuser)" if manager.is_superuser_connection(conn_name) else ""
-        print(f"  {status} Connection '{conn_name}'{superuser}")
+    # Bind methods once instead of re-resolving them per connection
+    health_check, is_superuser = manager.health_check, manager.is_superuser_connection
+    
+    # Health check all connections (independent, so run them concurrently)
+    names = manager.list_connections()
+    results = await asyncio.gather(
+        *(health_check(conn_name) for conn_name in names),
+        return_exceptions=True,
+    )
+    healthy = [conn_name for conn_name, result in zip(names, results) if result is True]
+    
+    # Report every connection in a single log record
+    if logger.isEnabledFor(logging.INFO):
+        lines = [
+            f"  [{'OK' if result is True else 'FAILED'}] Connection '{conn_name}'"
+            f"{' (superuser)' if is_superuser(conn_name) else ''}"
+            for conn_name, result in zip(names, results)
+        ]
+        logger.info("Initializing database connections:\n%s", "\n".join(lines))
+    
+    # Pre-create pooled connections for the healthy connections
+    if warmup:
+        await manager.warmup(healthy)
     
     return manager
 
@@ -137,11 +279,10 @@ async def shutdown_database() -> None:
     Close all database connections on application shutdown.
     
     Usage in FastAPI:
-        @app.on_event("shutdown")
-        async def shutdown():
-            await shutdown_database()
+        Await it after the yield of the application's lifespan
+        (see startup_database).
     """
     manager = get_manager()
-    print("🔌 Closing database connections...")
+    logger.info("Closing database connections...")
     await manager.close_all()
-    print("  ✅ All connections closed")
+    logger.info("All database connections closed")
@@ -3,14 +3,18 @@ Settings module for pgsqlasync2fast-fastapi
 Handles configuration using Pydantic Settings with environment variables
 """
 
-import os
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field, SecretStr, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Look for .env in the current working directory (where the app is running)
-DOTENV_PATH = os.path.join(os.getcwd(), ".env")
+# Look for .env in the current working directory (where the app is running).
+# Kept relative so no os.getcwd() call is made here; pydantic-settings resolves
+# it against the cwd each time DatabaseSettings() is instantiated. The module-level
+# `settings` singleton below is still built at import time, so it reads the .env
+# of the import-time cwd; instantiate DatabaseSettings() later to pick up another.
+DOTENV_PATH = ".env"
 
 
 class DatabaseConnectionSettings(BaseModel):
@@ -37,6 +41,13 @@ class DatabaseConnectionSettings(BaseModel):
         default=10,
         description="Maximum number of connections that can be created beyond pool_size"
     )
+    pool_autotune: bool = Field(
+        default=False,
+        description=(
+            "Size pool_size / max_overflow (whichever is not set explicitly) with "
+            "DatabaseManager.autotune_pool() instead of using the defaults"
+        )
+    )
     pool_timeout: int = Field(
         default=30,
         description="Timeout in seconds for getting a connection from the pool"
@@ -45,6 +56,24 @@ class DatabaseConnectionSettings(BaseModel):
         default=3600,
         description="Recycle connections after this many seconds (prevents stale connections)"
     )
+    pool_pre_ping: bool = Field(
+        default=True,
+        description="Check connections are alive on checkout (see pool_pre_ping_interval)"
+    )
+    pool_pre_ping_interval: int = Field(
+        default=30,
+        description=(
+            "Only ping a pooled connection on checkout if it has been idle in the pool "
+            "for this many seconds (0 pings on every checkout)"
+        )
+    )
+    pool_use_lifo: bool = Field(
+        default=True,
+        description=(
+            "Reuse the most recently returned connection first (LIFO), keeping a small "
+            "set of connections hot and letting idle ones be recycled"
+        )
+    )
     
     # SQLAlchemy settings
     echo: bool = Field(
@@ -52,29 +81,90 @@ class DatabaseConnectionSettings(BaseModel):
         description="Enable SQLAlchemy echo mode for this connection"
     )
 
-    @field_validator("port")
-    @classmethod
-    def validate_port(cls, v: int) -> int:
-        """Validate port is in valid range."""
-        if not 1 <= v <= 65535:
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "DatabaseConnectionSettings":
+        """Validate port and pool settings are in range (single validation pass)."""
+        if not 1 <= self.port <= 65535:
             raise ValueError("Port must be between 1 and 65535")
-        return v
-
-    @field_validator("pool_size")
-    @classmethod
-    def validate_pool_size(cls, v: int) -> int:
-        """Validate pool size is positive."""
-        if v <= 0:
+        if self.pool_size <= 0:
             raise ValueError("pool_size must be greater than 0")
-        return v
+        if self.max_overflow < 0:
+            raise ValueError("max_overflow must be non-negative")
+        if self.pool_pre_ping_interval < 0:
+            raise ValueError("pool_pre_ping_interval must be non-negative")
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class _ConnSnapshot:
+    """
+    Plain, immutable copy of a validated DatabaseConnectionSettings.
+    
+    Built once at settings load so engine creation reads slot attributes
+    instead of going through the Pydantic model. The *_explicit flags record
+    whether pool sizes were configured or left at their defaults (with
+    pool_autotune the manager autotunes the ones left at their defaults).
+    """
+
+    host: str
+    port: int
+    username: str
+    database: str
+    is_superuser: bool
+    pool_size: int
+    max_overflow: int
+    pool_size_explicit: bool
+    max_overflow_explicit: bool
+    pool_autotune: bool
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    pool_pre_ping_interval: int
+    pool_use_lifo: bool
+    echo: bool
+    password: str = field(repr=False)
+    url: str = field(repr=False)
+    # URL up to and including the "/" before the database name
+    url_prefix: str = field(repr=False)
+    # Model the snapshot was taken from, to detect replaced connections
+    source: DatabaseConnectionSettings = field(repr=False, compare=False)
+
+    def url_for_database(self, database: Optional[str] = None) -> str:
+        """Render the URL for another database on the same server/credentials."""
+        return self.url_prefix + (database or self.database)
 
-    @field_validator("max_overflow")
     @classmethod
-    def validate_max_overflow(cls, v: int) -> int:
-        """Validate max overflow is non-negative."""
-        if v < 0:
-            raise ValueError("max_overflow must be non-negative")
-        return v
+    def from_settings(cls, conn: DatabaseConnectionSettings) -> "_ConnSnapshot":
+        """Snapshot a validated connection configuration."""
+        fields_set = conn.model_fields_set
+        
+        # Unwrap the SecretStr once; every URL below is built from the plain string
+        password = conn.password.get_secret_value()
+        url_prefix = f"postgresql+asyncpg://{conn.username}:{password}@{conn.host}:{conn.port}/"
+        url = url_prefix + conn.database
+        
+        return cls(
+            host=conn.host,
+            port=conn.port,
+            username=conn.username,
+            database=conn.database,
+            is_superuser=conn.is_superuser,
+            pool_size=conn.pool_size,
+            max_overflow=conn.max_overflow,
+            pool_size_explicit="pool_size" in fields_set,
+            max_overflow_explicit="max_overflow" in fields_set,
+            pool_autotune=conn.pool_autotune,
+            pool_timeout=conn.pool_timeout,
+            pool_recycle=conn.pool_recycle,
+            pool_pre_ping=conn.pool_pre_ping,
+            pool_pre_ping_interval=conn.pool_pre_ping_interval,
+            pool_use_lifo=conn.pool_use_lifo,
+            echo=conn.echo,
+            password=password,
+            url=url,
+            url_prefix=url_prefix,
+            source=conn,
+        )
 
 
 class DatabaseSettings(BaseSettings):
@@ -106,6 +196,26 @@ class DatabaseSettings(BaseSettings):
         extra="ignore",
     )
 
+    # Name of the first superuser connection, indexed once at load time
+    _superuser_name: Optional[str] = PrivateAttr(default=None)
+    
+    # Frozen per-connection snapshots, built once at load time
+    _snapshot: Dict[str, _ConnSnapshot] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index the superuser connection and snapshot connections once loaded."""
+        self._superuser_name = self._find_superuser_name()
+        self._snapshot = {
+            name: _ConnSnapshot.from_settings(conn) for name, conn in self.connections.items()
+        }
+
+    def _find_superuser_name(self) -> Optional[str]:
+        """Scan connections for the first one with is_superuser=True."""
+        return next(
+            (name for name, conn in self.connections.items() if conn.is_superuser),
+            None,
+        )
+
     def get_connection(self, connection_name: Optional[str] = None) -> DatabaseConnectionSettings:
         """
         Get database connection configuration by name.
@@ -121,18 +231,50 @@ class DatabaseSettings(BaseSettings):
         """
         name = connection_name or self.default_connection
         
-        if name not in self.connections:
+        # Single hash probe; error message is only built on a miss
+        conn = self.connections.get(name)
+        if conn is None:
             available = ", ".join(self.connections.keys()) if self.connections else "none"
             raise ValueError(
                 f"Database connection '{name}' not found. Available connections: {available}"
             )
         
-        return self.connections[name]
+        return conn
+
+    def get_connection_snapshot(self, connection_name: Optional[str] = None) -> _ConnSnapshot:
+        """
+        Get the frozen snapshot of a connection configuration.
+        
+        The snapshot is rebuilt if the entry in connections has been replaced
+        since it was taken, so it always reflects the current configuration.
+        
+        Args:
+            connection_name: Name of the connection. If None, uses default_connection.
+            
+        Returns:
+            Immutable snapshot of the requested connection.
+            
+        Raises:
+            ValueError: If connection doesn't exist.
+        """
+        name = connection_name or self.default_connection
+        conn = self.get_connection(name)
+        
+        snapshot = self._snapshot.get(name)
+        if snapshot is None or snapshot.source is not conn:
+            # Connection added or replaced after load: snapshot the current model
+            snapshot = _ConnSnapshot.from_settings(conn)
+            self._snapshot[name] = snapshot
+        return snapshot
 
     def has_connection(self, connection_name: str) -> bool:
         """Check if a database connection exists."""
         return connection_name in self.connections
 
+    def __contains__(self, connection_name: object) -> bool:
+        """Support `name in settings` as a shorthand for has_connection()."""
+        return connection_name in self.connections
+
     def get_connection_url(self, connection_name: Optional[str] = None) -> str:
         """
         Get the database URL for a connection.
@@ -143,11 +285,7 @@ class DatabaseSettings(BaseSettings):
         Returns:
             PostgreSQL async connection URL.
         """
-        conn = self.get_connection(connection_name)
-        return (
-            f"postgresql+asyncpg://{conn.username}:{conn.password.get_secret_value()}"
-            f"@{conn.host}:{conn.port}/{conn.database}"
-        )
+        return self.get_connection_snapshot(connection_name).url
 
     def get_superuser_connection(self) -> Optional[DatabaseConnectionSettings]:
         """
@@ -156,10 +294,8 @@ class DatabaseSettings(BaseSettings):
         Returns:
             DatabaseConnectionSettings with is_superuser=True, or None if not found.
         """
-        for conn in self.connections.values():
-            if conn.is_superuser:
-                return conn
-        return None
+        name = self.get_superuser_connection_name()
+        return self.connections[name] if name is not None else None
 
     def get_superuser_connection_name(self) -> Optional[str]:
         """
@@ -168,10 +304,12 @@ class DatabaseSettings(BaseSettings):
         Returns:
             Name of connection with is_superuser=True, or None if not found.
         """
-        for name, conn in self.connections.items():
-            if conn.is_superuser:
-                return name
-        return None
+        name = self._superuser_name
+        if name is None or name not in self.connections:
+            # Nothing indexed (or the indexed connection was removed): rescan so
+            # connections added after load are found
+            name = self._superuser_name = self._find_superuser_name()
+        return name
 
 
 # Initialize settings with error handling
@@ -0,0 +1,28 @@
+"""
+Shared fixtures for the unit tests (no PostgreSQL server required)
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from pgsqlasync2fast_fastapi import DatabaseManager, DatabaseSettings
+
+
+def make_settings(**connections: dict) -> DatabaseSettings:
+    """Build settings for the given connections, ignoring any .env file."""
+    base = {"host": "localhost", "username": "user", "password": "pass", "database": "db"}
+    return DatabaseSettings(
+        _env_file=None,
+        connections={name: {**base, **conn} for name, conn in connections.items()},
+    )
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """DatabaseManager whose "default" connection is backed by a SQLite file."""
+    manager = DatabaseManager(make_settings(default={}))
+    manager._engines["default"] = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    )
+    yield manager
+    await manager.close_all()
@@ -42,7 +42,7 @@ async def main():
     print("\n🔌 PASO 2: Probando conexión DEFAULT")
     print("-" * 60)
     try:
-        session = await manager.get_session("default")
+        session = manager.get_session("default")
         
         # Obtener información de la base de datos
         result = await session.execute(text("SELECT current_database(), current_user"))
@@ -63,7 +63,7 @@ async def main():
     print("\n🔑 PASO 3: Probando conexión ADMIN (superusuario)")
     print("-" * 60)
     try:
-        session = await manager.get_session("admin")
+        session = manager.get_session("admin")
         
         result = await session.execute(text("SELECT current_database(), current_user"))
         db_name, user = result.fetchone()
@@ -118,19 +118,8 @@ async def main():
     print("-" * 60)
     try:
         # Crear una nueva conexión temporal a la base de datos creada
-        from pgsqlasync2fast_fastapi.settings import DatabaseConnectionSettings
-        from sqlalchemy.ext.asyncio import create_async_engine
-        from pydantic import SecretStr
-        
-        # Usar las credenciales del usuario DEFAULT
-        conn_settings = manager.config.get_connection("default")
-        temp_url = (
-            f"postgresql+asyncpg://{conn_settings.username}:"
-            f"{conn_settings.password.get_secret_value()}"
-            f"@{conn_settings.host}:{conn_settings.port}/{test_db_name}"
-        )
-        
-        temp_engine = create_async_engine(temp_url, echo=False)
+        # usando las credenciales del usuario DEFAULT
+        temp_engine = manager.make_engine("default", database=test_db_name, echo=False)
         async with temp_engine.connect() as conn:
             result = await conn.execute(text("SELECT current_database()"))
             db = result.scalar()
@@ -0,0 +1,120 @@
+"""
+Tests for DatabaseManager pool sizing and interval pre-ping
+"""
+
+import pytest
+from sqlalchemy import event, text
+
+from pgsqlasync2fast_fastapi import DatabaseManager, connection
+from pgsqlasync2fast_fastapi.connection import MAX_AUTOTUNED_POOL_SIZE, _install_interval_pre_ping
+
+from conftest import make_settings
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(connection, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def pinged_engine(manager, clock, monkeypatch):
+    """Default engine guarded by a 30s interval pre-ping, recording pings."""
+    engine = manager.get_engine()
+    pings = []
+
+    def do_ping(dbapi_connection):
+        pings.append(dbapi_connection)
+        return True
+
+    monkeypatch.setattr(engine.sync_engine.dialect, "do_ping", do_ping)
+    _install_interval_pre_ping(engine, 30)
+    return engine, pings
+
+
+async def test_pre_ping_skips_recently_used_connections(pinged_engine, clock):
+    engine, pings = pinged_engine
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    clock.now += 20
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    # Checkin refreshed the timestamp, so 20s later it is still fresh
+    clock.now += 20
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    assert pings == []
+
+
+async def test_pre_ping_checks_idle_connections(pinged_engine, clock):
+    engine, pings = pinged_engine
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    clock.now += 31
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    assert len(pings) == 1
+
+
+async def test_pre_ping_replaces_failed_connection(pinged_engine, clock, monkeypatch):
+    engine, pings = pinged_engine
+    connects = []
+    event.listen(engine.sync_engine, "connect", lambda dbapi_conn, record: connects.append(1))
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    def failing_ping(dbapi_connection):
+        raise OSError("connection reset")
+
+    monkeypatch.setattr(engine.sync_engine.dialect, "do_ping", failing_ping)
+    clock.now += 31
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+
+    assert len(connects) == 2
+
+
+def test_autotune_pool_ignores_invalid_web_concurrency(monkeypatch):
+    monkeypatch.setattr(connection.os, "cpu_count", lambda: 4)
+    monkeypatch.setenv("WEB_CONCURRENCY", "abc")
+    assert DatabaseManager.autotune_pool() == {"pool_size": 9, "max_overflow": 9}
+
+    monkeypatch.setenv("WEB_CONCURRENCY", "2")
+    assert DatabaseManager.autotune_pool() == {"pool_size": 5, "max_overflow": 5}
+
+
+def test_autotune_pool_is_capped():
+    tuned = DatabaseManager.autotune_pool(concurrency=500)
+    assert tuned == {"pool_size": MAX_AUTOTUNED_POOL_SIZE, "max_overflow": MAX_AUTOTUNED_POOL_SIZE}
+
+
+async def test_pool_sizes_use_defaults_unless_autotuned():
+    manager = DatabaseManager(
+        make_settings(
+            default={},
+            tuned={"pool_autotune": True, "max_overflow": 2},
+        )
+    )
+    try:
+        default = manager.get_engine("default").pool
+        assert (default.size(), default._max_overflow) == (5, 10)
+
+        tuned = manager.get_engine("tuned").pool
+        expected = DatabaseManager.autotune_pool()["pool_size"]
+        assert (tuned.size(), tuned._max_overflow) == (expected, 2)
+    finally:
+        await manager.close_all()
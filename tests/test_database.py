@@ -0,0 +1,37 @@
+"""
+Tests for the database utility helpers
+"""
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from pgsqlasync2fast_fastapi.database import _sqlstate, _validate_identifier
+
+
+@pytest.mark.parametrize("name", ["mydb", "_tmp", "Db_2024", "a" * 63])
+def test_validate_identifier_accepts_valid_names(name):
+    assert _validate_identifier(name, "database name") == name
+
+
+@pytest.mark.parametrize(
+    "name", ["", "bad\n", "1db", "my-db", 'x"; DROP DATABASE y; --', "a" * 64]
+)
+def test_validate_identifier_rejects_invalid_names(name):
+    with pytest.raises(ValueError):
+        _validate_identifier(name, "database name")
+
+
+class _DriverError(Exception):
+    def __init__(self, sqlstate):
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+def test_sqlstate_reads_driver_error_code():
+    error = DBAPIError("CREATE DATABASE x", None, _DriverError("42P04"))
+    assert _sqlstate(error) == "42P04"
+
+
+def test_sqlstate_is_none_without_code():
+    error = DBAPIError("CREATE DATABASE x", None, Exception("boom"))
+    assert _sqlstate(error) is None
@@ -0,0 +1,83 @@
+"""
+Tests for the request-scoped session dependencies
+"""
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pgsqlasync2fast_fastapi import get_db_manager, get_db_session, make_session_dep
+
+get_default_session = make_session_dep("default")
+
+
+def make_app(manager) -> FastAPI:
+    app = FastAPI()
+    app.dependency_overrides[get_db_manager] = lambda: manager
+
+    async def nested(session: AsyncSession = Depends(get_default_session)) -> AsyncSession:
+        return session
+
+    @app.get("/shared")
+    async def shared(
+        session: AsyncSession = Depends(get_db_session),
+        other: AsyncSession = Depends(nested),
+    ):
+        return {"shared": session is other}
+
+    @app.post("/items")
+    async def add_item(session: AsyncSession = Depends(get_db_session)):
+        await session.execute(text("CREATE TABLE IF NOT EXISTS items (name TEXT)"))
+        await session.execute(text("INSERT INTO items VALUES ('a')"))
+        return {"ok": True}
+
+    @app.get("/fail")
+    async def fail(session: AsyncSession = Depends(get_db_session)):
+        await session.execute(text("SELECT 1"))
+        raise RuntimeError("boom")
+
+    return app
+
+
+def client(app: FastAPI) -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def test_dependencies_share_one_session(manager):
+    async with client(make_app(manager)) as c:
+        response = await c.get("/shared")
+
+    assert response.json() == {"shared": True}
+    assert not manager.get_scoped_session("default").registry.registry
+
+
+async def test_session_is_committed_and_released(manager):
+    async with client(make_app(manager)) as c:
+        response = await c.post("/items")
+
+    assert response.status_code == 200
+    assert not manager.get_scoped_session("default").registry.registry
+
+    async with manager.get_session() as session:
+        result = await session.execute(text("SELECT name FROM items"))
+        assert list(result.scalars()) == ["a"]
+
+
+async def test_session_is_released_after_error(manager):
+    async with client(make_app(manager)) as c:
+        response = await c.get("/fail")
+
+    assert response.status_code == 500
+    assert not manager.get_scoped_session("default").registry.registry
+    assert manager.get_engine().pool.checkedout() == 0
+
+
+async def test_scoped_session_is_bound(manager):
+    scoped = manager.get_scoped_session("default")
+    try:
+        result = await scoped().execute(text("SELECT 1"))
+        assert result.scalar() == 1
+    finally:
+        await scoped.remove()